@@ -1,7 +1,7 @@
 """
 Demo Website Server
 ===================
-A simple HTTP server that serves the demo sign-up page on port 3000.
+A simple threaded HTTP server that serves the demo sign-up page on port 3000.
 This simulates a *third-party website* that embeds the CAPTCHA widget
 from the CAPTCHA service running on port 8000.
 
@@ -26,7 +26,7 @@ if __name__ == "__main__":
     print(f"     if the CAPTCHA API runs on a different host/port.")
     print(f"  ⏹  Press Ctrl+C to stop\n")
 
-    with http.server.HTTPServer(("", PORT), Handler) as httpd:
+    with http.server.ThreadingHTTPServer(("", PORT), Handler) as httpd:
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
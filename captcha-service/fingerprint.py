@@ -1,19 +1,116 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import itertools
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, List, Optional
 
+import numpy as np
+import orjson
+
+
+# Maximum number of trajectory points kept per session.
+MAX_TRAJECTORY_POINTS = 600
+
+# Requests carrying more points than this are rejected outright.
+MAX_TRAJECTORY_PAYLOAD = 10_000
+
+# Risk flags in reporting order, and the score penalty for each.
+# ``analyze_bot_risk`` records raised flags as bits of an int.
+FLAG_NAMES = (
+    "suspicious_user_agent",
+    "invalid_screen_resolution",
+    "webdriver_detected",
+    "missing_timezone",
+    "missing_canvas_fingerprint",
+    "missing_fingerprint",
+    "linear_velocity_pattern",
+    "uniform_delta_pattern",
+    "low_slider_entropy",
+    "no_movement_pauses",
+    "insufficient_trajectory_data",
+    "invalid_behavior_duration",
+    "suspiciously_fast",
+    "very_fast",
+    "suspiciously_slow",
+    "missing_mousedown",
+    "insufficient_mouse_movement",
+    "limited_mouse_movement",
+    "low_event_count",
+    "missing_behavior_data",
+)
+FLAG_PENALTIES = (20, 15, 35, 5, 10, 30, 20, 15, 15, 15, 30, 20, 25, 10, 10, 10, 20, 10, 10, 25)
+
+(
+    _SUSPICIOUS_USER_AGENT,
+    _INVALID_SCREEN_RESOLUTION,
+    _WEBDRIVER_DETECTED,
+    _MISSING_TIMEZONE,
+    _MISSING_CANVAS_FINGERPRINT,
+    _MISSING_FINGERPRINT,
+    _LINEAR_VELOCITY_PATTERN,
+    _UNIFORM_DELTA_PATTERN,
+    _LOW_SLIDER_ENTROPY,
+    _NO_MOVEMENT_PAUSES,
+    _INSUFFICIENT_TRAJECTORY_DATA,
+    _INVALID_BEHAVIOR_DURATION,
+    _SUSPICIOUSLY_FAST,
+    _VERY_FAST,
+    _SUSPICIOUSLY_SLOW,
+    _MISSING_MOUSEDOWN,
+    _INSUFFICIENT_MOUSE_MOVEMENT,
+    _LIMITED_MOUSE_MOVEMENT,
+    _LOW_EVENT_COUNT,
+    _MISSING_BEHAVIOR_DATA,
+) = (1 << i for i in range(len(FLAG_NAMES)))
+
+
+def _penalty_table(first_bit: int) -> tuple[int, ...]:
+    """Total penalty for every combination of flags *first_bit*..+7."""
+    penalties = FLAG_PENALTIES[first_bit : first_bit + 8]
+    return tuple(
+        sum(p for i, p in enumerate(penalties) if byte >> i & 1)
+        for byte in range(256)
+    )
+
+
+_PENALTY_BYTE0 = _penalty_table(0)
+_PENALTY_BYTE1 = _penalty_table(8)
+_PENALTY_BYTE2 = _penalty_table(16)
+
+
+@functools.lru_cache(maxsize=1024)
+def _flag_names(bits: int) -> tuple[str, ...]:
+    """``FLAG_NAMES`` entries set in *bits*, built once per combination."""
+    return tuple(name for i, name in enumerate(FLAG_NAMES) if bits >> i & 1)
+
 
-@dataclass
-class TrajectoryPoint:
-    timestamp: int
-    value: float
-    delta: float
-    velocity: float
-    time_delta_ms: int
+def _penalty(bits: int) -> int:
+    """Sum of ``FLAG_PENALTIES`` for the flags set in *bits*."""
+    return (
+        _PENALTY_BYTE0[bits & 0xFF]
+        + _PENALTY_BYTE1[bits >> 8 & 0xFF]
+        + _PENALTY_BYTE2[bits >> 16]
+    )
+
+
+@dataclass(slots=True)
+class Trajectory:
+    """Slider trajectory stored column-wise, one array per point field."""
 
+    timestamp: np.ndarray
+    value: np.ndarray
+    delta: np.ndarray
+    velocity: np.ndarray
+    time_delta_ms: np.ndarray
 
-@dataclass
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+
+@dataclass(slots=True)
 class BehaviorData:
     start_time: int
     end_time: int
@@ -24,61 +121,96 @@ class BehaviorData:
     events: List[dict]
 
 
-@dataclass
+@dataclass(slots=True)
 class CaptchaSession:
     solved_value: int
     fingerprint: Optional[dict] = None
-    trajectory: Optional[List[TrajectoryPoint]] = None
+    trajectory: Optional[Trajectory] = None
     behavior: Optional[BehaviorData] = None
 
 
-def parse_trajectory(trajectory: Any) -> list[TrajectoryPoint]:
-    parsed_trajectory: list[TrajectoryPoint] = []
+_JSON_NUMBER = (int, float)
+
+
+def parse_trajectory(trajectory: Any) -> Trajectory:
     if not isinstance(trajectory, list):
-        return parsed_trajectory
+        trajectory = []
+
+    n = min(len(trajectory), MAX_TRAJECTORY_POINTS)
+    timestamp = np.empty(n, dtype=np.int64)
+    value = np.empty(n, dtype=np.float64)
+    delta = np.empty(n, dtype=np.float64)
+    velocity = np.empty(n, dtype=np.float64)
+    time_delta_ms = np.empty(n, dtype=np.int64)
 
-    for point in trajectory[:600]:
+    i = 0
+    for point in itertools.islice(trajectory, n):
         if not isinstance(point, dict):
             continue
+        g = point.get
+        ts = g("timestamp", 0)
+        v = g("value", 0)
+        d = g("delta", 0)
+        vel = g("velocity", 0)
+        td = g("time_delta_ms", 0)
         try:
-            parsed_trajectory.append(
-                TrajectoryPoint(
-                    timestamp=int(point.get("timestamp", 0)),
-                    value=float(point.get("value", 0)),
-                    delta=float(point.get("delta", 0)),
-                    velocity=float(point.get("velocity", 0)),
-                    time_delta_ms=max(0, int(point.get("time_delta_ms", 0))),
-                )
-            )
+            # Decoded JSON almost always carries plain ints/floats already;
+            # only coerce (strings, bools, ...) when it doesn't.
+            if not (
+                type(ts) is int
+                and type(td) is int
+                and type(v) in _JSON_NUMBER
+                and type(d) in _JSON_NUMBER
+                and type(vel) in _JSON_NUMBER
+            ):
+                ts, v, d, vel, td = int(ts), float(v), float(d), float(vel), int(td)
+            timestamp[i] = ts
+            value[i] = v
+            delta[i] = d
+            velocity[i] = vel
+            time_delta_ms[i] = td if td > 0 else 0
         except Exception:
             continue
-
-    return parsed_trajectory
+        i += 1
+
+    return Trajectory(
+        timestamp=timestamp[:i],
+        value=value[:i],
+        delta=delta[:i],
+        velocity=velocity[:i],
+        time_delta_ms=time_delta_ms[:i],
+    )
 
 
 def parse_behavior(behavior: Any) -> BehaviorData | None:
     if not isinstance(behavior, dict):
         return None
 
+    g = behavior.get
+    events = g("events")
     try:
         return BehaviorData(
-            start_time=int(behavior.get("start_time", 0) or 0),
-            end_time=int(behavior.get("end_time", 0) or 0),
-            total_duration_ms=max(0, int(behavior.get("total_duration_ms", 0) or 0)),
-            event_count=max(0, int(behavior.get("event_count", 0) or 0)),
-            mouse_down_count=max(0, int(behavior.get("mouse_down_count", 0) or 0)),
-            mouse_move_count=max(0, int(behavior.get("mouse_move_count", 0) or 0)),
-            events=behavior.get("events") or []
-            if isinstance(behavior.get("events"), list)
-            else [],
+            start_time=int(g("start_time") or 0),
+            end_time=int(g("end_time") or 0),
+            total_duration_ms=max(0, int(g("total_duration_ms") or 0)),
+            event_count=max(0, int(g("event_count") or 0)),
+            mouse_down_count=max(0, int(g("mouse_down_count") or 0)),
+            mouse_move_count=max(0, int(g("mouse_move_count") or 0)),
+            events=events if isinstance(events, list) else [],
         )
     except Exception:
         return None
 
 
+# (risk_level, difficulty) for every confidence score 0..100.
+_RISK_TIER_BY_SCORE = (
+    (("high", 22),) * 40 + (("medium", 19),) * 30 + (("low", 15),) * 31
+)
+
+
 def compute_pow_difficulty(
     fingerprint: dict | None = None,
-    trajectory: list[TrajectoryPoint] | None = None,
+    trajectory: Trajectory | None = None,
     behavior: BehaviorData | None = None,
 ) -> dict[str, Any]:
     """
@@ -91,24 +223,33 @@ def compute_pow_difficulty(
       - score >= 40  →  medium     →  difficulty 20  (~1M hashes)
       - score <  40  →  high risk  →  difficulty 26  (~67M hashes)
 
-    Returns ``{ difficulty, risk_level, score, flags }``.
+    Returns ``{ difficulty, risk_level, score, flags }``.  For high-risk
+    sessions decided before the trajectory scan, ``score`` and ``flags``
+    omit the trajectory checks.  Results are memoised by session
+    content; treat the returned dict as read-only.
     """
-    session = CaptchaSession(
-        solved_value=0,
-        fingerprint=fingerprint,
-        trajectory=trajectory,
-        behavior=behavior,
+    if fingerprint is None and not trajectory and behavior is None:
+        return _ALL_MISSING_POW_DIFFICULTY
+
+    key = _session_key(fingerprint, trajectory, behavior)
+    if key is not None:
+        cached = _pow_cache.lookup(key)
+        if cached is not None:
+            return cached
+
+    # Below 40 the tier is "high" whatever the trajectory looks like.
+    pow_difficulty = _pow_difficulty(
+        _analyze(fingerprint, trajectory, behavior, stop_below=40)
     )
-    result = analyze_bot_risk(session)
-    score = result["confidence_score"]
+    if key is not None:
+        _pow_cache.store(key, pow_difficulty)
+    return pow_difficulty
 
-    if score >= 70:
-        risk_level, difficulty = "low", 15
-    elif score >= 40:
-        risk_level, difficulty = "medium", 19
-    else:
-        risk_level, difficulty = "high", 22
 
+def _pow_difficulty(result: dict[str, Any]) -> dict[str, Any]:
+    """Map a risk analysis result to its PoW tier."""
+    score = result["confidence_score"]
+    risk_level, difficulty = _RISK_TIER_BY_SCORE[score]
     return {
         "difficulty": difficulty,
         "risk_level": risk_level,
@@ -117,124 +258,375 @@ def compute_pow_difficulty(
     }
 
 
-def analyze_bot_risk(session: CaptchaSession) -> dict[str, Any]:
-    flags = []
-    score = 100
-    if session.fingerprint:
-        fp = session.fingerprint
+# Distinct slider values below which a trajectory counts as low-entropy.
+_MIN_DISTINCT_VALUES = 4
+
+# Slider values are compared as ``int(value)``.  Both backends get the
+# same int64 keys from ``_value_keys``: NaN counts as 0 and values are
+# clamped to ±2**53 (where floats still hold exact integers), so the
+# conversion is defined for any client input.
+_VALUE_KEY_LIMIT = float(2**53)
+
+
+def _value_keys(value: np.ndarray) -> np.ndarray:
+    """Truncate slider values to the int64 keys distinct-counting uses."""
+    clamped = np.clip(np.nan_to_num(value), -_VALUE_KEY_LIMIT, _VALUE_KEY_LIMIT)
+    return clamped.astype(np.int64)
+
+
+def _variance(x: np.ndarray) -> float:
+    """
+    Population variance of *x* (0.0 for an empty array).
+
+    Two-pass (mean, then squared deviations), like the Numba kernel:
+    client-supplied values can be large and near-constant, where
+    ``E[x²] - E[x]²`` cancels to noise and can hide a linear pattern.
+    """
+    if not x.size:
+        return 0.0
+    return float(np.var(x))
+
+
+def _count_distinct(keys: np.ndarray, limit: int) -> int:
+    """
+    Number of distinct entries in the int64 *keys*, counting no further
+    than *limit*.
+
+    Stops scanning as soon as *limit* values have been seen, which for
+    human trajectories is within the first few points; memory is at
+    most *limit* set entries however long the trajectory is.  Should
+    the threshold ever grow large, a HyperLogLog sketch would keep the
+    same fixed-size bound.
+    """
+    seen = set()
+    for v in keys.tolist():
+        seen.add(v)
+        if len(seen) >= limit:
+            break
+    return len(seen)
+
+
+def _trajectory_stats_numpy(
+    velocity: np.ndarray,
+    delta: np.ndarray,
+    value_keys: np.ndarray,
+    time_delta_ms: np.ndarray,
+) -> tuple[int, float, int, float, int, int]:
+    """NumPy implementation of ``_trajectory_stats``."""
+    moving = time_delta_ms > 0
+    velocities = velocity[moving]
+    deltas = np.abs(delta[delta != 0])
+    return (
+        int(velocities.size),
+        _variance(velocities),
+        int(deltas.size),
+        _variance(deltas),
+        _count_distinct(value_keys, _MIN_DISTINCT_VALUES),
+        int(np.count_nonzero(time_delta_ms[moving] >= 120)),
+    )
+
+
+def _load_trajectory_kernel():
+    """
+    JIT-compile the trajectory statistics kernel with Numba.
+
+    The explicit signature makes Numba compile eagerly at import time
+    (and ``cache=True`` persists the machine code next to this module),
+    so no request pays the first-call JIT latency.  Returns ``None``
+    when Numba isn't installed; callers then use the NumPy version.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(
+        "Tuple((i8, f8, i8, f8, i8, i8))(f8[:], f8[:], i8[:], i8[:])",
+        cache=True,
+    )
+    def kernel(velocity, delta, value_keys, time_delta_ms):
+        n = velocity.shape[0]
+        # Pass 1: counts, sums, pauses, distinct values.
+        n_v, sum_v = 0, 0.0
+        n_d, sum_d = 0, 0.0
+        pauses = 0
+        # Exact, like ``_count_distinct``: at most _MIN_DISTINCT_VALUES
+        # keys are ever held, so a linear scan is cheapest.
+        seen = np.empty(_MIN_DISTINCT_VALUES, dtype=np.int64)
+        distinct = 0
+        for i in range(n):
+            if time_delta_ms[i] > 0:
+                n_v += 1
+                sum_v += velocity[i]
+                if time_delta_ms[i] >= 120:
+                    pauses += 1
+            if delta[i] != 0:
+                n_d += 1
+                sum_d += abs(delta[i])
+            if distinct < _MIN_DISTINCT_VALUES:
+                key = value_keys[i]
+                new = True
+                for j in range(distinct):
+                    if seen[j] == key:
+                        new = False
+                        break
+                if new:
+                    seen[distinct] = key
+                    distinct += 1
+        # Pass 2: squared deviations from the means (no cancellation).
+        mean_v = sum_v / n_v if n_v else 0.0
+        mean_d = sum_d / n_d if n_d else 0.0
+        m2_v, m2_d = 0.0, 0.0
+        for i in range(n):
+            if time_delta_ms[i] > 0:
+                m2_v += (velocity[i] - mean_v) ** 2
+            if delta[i] != 0:
+                m2_d += (abs(delta[i]) - mean_d) ** 2
+        var_v = m2_v / n_v if n_v else 0.0
+        var_d = m2_d / n_d if n_d else 0.0
+        return n_v, var_v, n_d, var_d, distinct, pauses
+
+    return kernel
+
+
+# Compiled once at import time; ``None`` without Numba.
+_trajectory_kernel = _load_trajectory_kernel()
+
+
+def _trajectory_stats(
+    velocity: np.ndarray,
+    delta: np.ndarray,
+    value: np.ndarray,
+    time_delta_ms: np.ndarray,
+) -> tuple[int, float, int, float, int, int]:
+    """
+    Trajectory statistics used by ``analyze_bot_risk``.
+
+    Returns ``(n_moving, velocity_variance, n_deltas, delta_variance,
+    distinct_values, pause_count)`` where velocities and pauses only
+    consider points with a positive ``time_delta_ms``, deltas only the
+    non-zero ones (as magnitudes), and the distinct-value count
+    saturates at ``_MIN_DISTINCT_VALUES``.
+    """
+    keys = _value_keys(value)
+    if _trajectory_kernel is not None:
+        return _trajectory_kernel(velocity, delta, keys, time_delta_ms)
+    return _trajectory_stats_numpy(velocity, delta, keys, time_delta_ms)
+
+
+class _LRUCache(OrderedDict):
+    """Bounded mapping that evicts its least recently used entry."""
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+
+    def lookup(self, key: Any) -> Any:
+        value = self.get(key)
+        if value is not None:
+            self.move_to_end(key)
+        return value
+
+    def store(self, key: Any, value: Any) -> None:
+        self[key] = value
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+# Risk results and PoW tiers keyed by session content; retries and
+# replayed submissions hit these instead of re-running the analysis.
+_risk_cache = _LRUCache(maxsize=4096)
+_pow_cache = _LRUCache(maxsize=2048)
+
+
+def _session_key(
+    fingerprint: dict | None,
+    trajectory: Trajectory | None,
+    behavior: BehaviorData | None,
+) -> bytes | None:
+    """
+    Content hash of everything the risk analysis reads.
+
+    Returns ``None`` if the fingerprint can't be serialised (e.g. an
+    integer too large for orjson); such sessions simply aren't cached.
+    """
+    try:
+        fp_json = orjson.dumps(fingerprint, option=orjson.OPT_SORT_KEYS)
+    except orjson.JSONEncodeError:
+        return None
+
+    h = hashlib.blake2b(fp_json, digest_size=16)
+    if trajectory is None:
+        h.update(b"\x00")
+    else:
+        h.update(b"\x01" + len(trajectory).to_bytes(4, "little"))
+        for column in (
+            trajectory.value,
+            trajectory.delta,
+            trajectory.velocity,
+            trajectory.time_delta_ms,
+        ):
+            h.update(column.tobytes())
+    if behavior is None:
+        h.update(b"\x00")
+    else:
+        h.update(
+            b"\x01"
+            + orjson.dumps(
+                (
+                    behavior.total_duration_ms,
+                    behavior.event_count,
+                    behavior.mouse_down_count,
+                    behavior.mouse_move_count,
+                )
+            )
+        )
+    return h.digest()
+
+
+def analyze_bot_risk(
+    session: CaptchaSession, stop_below: int | None = None
+) -> dict[str, Any]:
+    """
+    Score *session* from 0 (bot) to 100 (human) and list the flags raised.
+
+    Penalties only ever lower the score, so once it has dropped below
+    *stop_below* the caller's decision is fixed.  In that case the O(n)
+    trajectory checks are skipped and the returned score and flags only
+    reflect the fingerprint and behaviour checks.
+
+    Results are memoised by session content and shared between callers,
+    so treat the returned dict as read-only.
+    """
+    fingerprint = session.fingerprint
+    trajectory = session.trajectory
+    behavior = session.behavior
+    if fingerprint is None and not trajectory and behavior is None:
+        return _ALL_MISSING_RESULT
+
+    key = _session_key(fingerprint, trajectory, behavior)
+    if key is None:
+        return _analyze(fingerprint, trajectory, behavior, stop_below)
+
+    result = _risk_cache.lookup((key, stop_below))
+    if result is None:
+        result = _analyze(fingerprint, trajectory, behavior, stop_below)
+        _risk_cache.store((key, stop_below), result)
+    return result
+
+
+def _analyze(
+    fingerprint: dict | None,
+    trajectory: Trajectory | None,
+    behavior: BehaviorData | None,
+    stop_below: int | None,
+) -> dict[str, Any]:
+    """Risk analysis behind ``analyze_bot_risk``, on the bare session fields."""
+    bits = 0
+    if fingerprint:
+        fp = fingerprint
         user_agent = str(fp.get("user_agent") or "")
         if len(user_agent) < 20:
-            flags.append("suspicious_user_agent")
-            score -= 20
-
-        screen_resolution = str(fp.get("screen_resolution") or "")
-        try:
-            screen_w, screen_h = [
-                int(v) for v in screen_resolution.lower().split("x", 1)
-            ]
-            if screen_w <= 0 or screen_h <= 0:
-                flags.append("invalid_screen_resolution")
-                score -= 15
-        except Exception:
-            flags.append("invalid_screen_resolution")
-            score -= 15
+            bits |= _SUSPICIOUS_USER_AGENT
+
+        # "<w>x<h>", separator in either case.
+        screen_resolution = fp.get("screen_resolution")
+        screen_w = screen_h = 0
+        if isinstance(screen_resolution, str):
+            sep = screen_resolution.find("x")
+            if sep < 0:
+                sep = screen_resolution.find("X")
+            if sep >= 0:
+                try:
+                    screen_w = int(screen_resolution[:sep])
+                    screen_h = int(screen_resolution[sep + 1 :])
+                except ValueError:
+                    pass
+        if screen_w <= 0 or screen_h <= 0:
+            bits |= _INVALID_SCREEN_RESOLUTION
 
         if bool(fp.get("webdriver")):
-            flags.append("webdriver_detected")
-            score -= 35
+            bits |= _WEBDRIVER_DETECTED
 
         if not fp.get("timezone_name"):
-            flags.append("missing_timezone")
-            score -= 5
+            bits |= _MISSING_TIMEZONE
 
         if not fp.get("canvas_fingerprint"):
-            flags.append("missing_canvas_fingerprint")
-            score -= 10
+            bits |= _MISSING_CANVAS_FINGERPRINT
     else:
-        flags.append("missing_fingerprint")
-        score -= 30
-
-    if session.trajectory and len(session.trajectory) >= 4:
-        velocities = [p.velocity for p in session.trajectory if p.time_delta_ms > 0]
-        if velocities:
-            vel_mean = sum(velocities) / len(velocities)
-            vel_variance = sum((v - vel_mean) ** 2 for v in velocities) / len(velocities)
-            if vel_variance < 0.003:
-                flags.append("linear_velocity_pattern")
-                score -= 20
-
-        non_zero_deltas = [abs(p.delta) for p in session.trajectory if p.delta != 0]
-        if non_zero_deltas:
-            delta_mean = sum(non_zero_deltas) / len(non_zero_deltas)
-            delta_variance = sum((d - delta_mean) ** 2 for d in non_zero_deltas) / len(
-                non_zero_deltas
-            )
-            if delta_variance < 0.2 and len(non_zero_deltas) >= 4:
-                flags.append("uniform_delta_pattern")
-                score -= 15
-
-        unique_values = {int(p.value) for p in session.trajectory}
-        if len(unique_values) < 4:
-            flags.append("low_slider_entropy")
-            score -= 15
-
-        time_deltas = [p.time_delta_ms for p in session.trajectory if p.time_delta_ms > 0]
-        if time_deltas:
-            pauses = [d for d in time_deltas if d >= 120]
-            if len(pauses) == 0:
-                flags.append("no_movement_pauses")
-                score -= 15
-    else:
-        flags.append("insufficient_trajectory_data")
-        score -= 30
+        bits |= _MISSING_FINGERPRINT
 
-    if session.behavior:
-        duration = session.behavior.total_duration_ms
+    # Behaviour checks are O(1), so they run before the O(n) trajectory
+    # scan; flag order comes from the bit positions, not evaluation order.
+    if behavior:
+        duration = behavior.total_duration_ms
         if duration <= 0:
-            flags.append("invalid_behavior_duration")
-            score -= 20
+            bits |= _INVALID_BEHAVIOR_DURATION
         elif duration < 300:
-            flags.append("suspiciously_fast")
-            score -= 25
+            bits |= _SUSPICIOUSLY_FAST
         elif duration < 700:
-            flags.append("very_fast")
-            score -= 10
+            bits |= _VERY_FAST
         elif duration > 45000:
-            flags.append("suspiciously_slow")
-            score -= 10
-
-        if session.behavior.mouse_down_count < 1:
-            flags.append("missing_mousedown")
-            score -= 10
-
-        if session.behavior.mouse_move_count < 3:
-            flags.append("insufficient_mouse_movement")
-            score -= 20
-        elif session.behavior.mouse_move_count < 8:
-            flags.append("limited_mouse_movement")
-            score -= 10
-
-        if session.behavior.event_count < 3:
-            flags.append("low_event_count")
-            score -= 10
+            bits |= _SUSPICIOUSLY_SLOW
+
+        if behavior.mouse_down_count < 1:
+            bits |= _MISSING_MOUSEDOWN
+
+        if behavior.mouse_move_count < 3:
+            bits |= _INSUFFICIENT_MOUSE_MOVEMENT
+        elif behavior.mouse_move_count < 8:
+            bits |= _LIMITED_MOUSE_MOVEMENT
+
+        if behavior.event_count < 3:
+            bits |= _LOW_EVENT_COUNT
     else:
-        flags.append("missing_behavior_data")
-        score -= 25
+        bits |= _MISSING_BEHAVIOR_DATA
+
+    if stop_below is not None and 100 - _penalty(bits) < stop_below:
+        pass  # tier already decided; skip the trajectory scan
+    elif trajectory and len(trajectory) >= 4:
+        n_v, vel_variance, n_d, delta_variance, distinct, pause_count = (
+            _trajectory_stats(
+                trajectory.velocity,
+                trajectory.delta,
+                trajectory.value,
+                trajectory.time_delta_ms,
+            )
+        )
+
+        if n_v and vel_variance < 0.003:
+            bits |= _LINEAR_VELOCITY_PATTERN
+
+        if n_d >= 4 and delta_variance < 0.2:
+            bits |= _UNIFORM_DELTA_PATTERN
 
-    score = max(0, min(100, score))
+        if distinct < _MIN_DISTINCT_VALUES:
+            bits |= _LOW_SLIDER_ENTROPY
+
+        # Velocities and time deltas share the ``time_delta_ms > 0`` filter.
+        if n_v and pause_count == 0:
+            bits |= _NO_MOVEMENT_PAUSES
+    else:
+        bits |= _INSUFFICIENT_TRAJECTORY_DATA
+
+    score = max(0, 100 - _penalty(bits))
     is_bot = score < 60
     return {
         "is_bot": is_bot,
         "confidence_score": score,
-        "flags": flags,
+        "flags": list(_flag_names(bits)),
         "details": {
-            "fingerprint_present": session.fingerprint is not None,
-            "trajectory_points": len(session.trajectory) if session.trajectory else 0,
-            "total_duration_ms": session.behavior.total_duration_ms
-            if session.behavior
-            else 0,
-            "movement_events": session.behavior.mouse_move_count
-            if session.behavior
-            else 0,
+            "fingerprint_present": fingerprint is not None,
+            "trajectory_points": len(trajectory) if trajectory else 0,
+            "total_duration_ms": behavior.total_duration_ms if behavior else 0,
+            "movement_events": behavior.mouse_move_count if behavior else 0,
         },
     }
+
+
+# Submissions without any telemetry are the bulk of scripted traffic;
+# their outcome is fixed, so it is computed once here.
+_ALL_MISSING_RESULT = _analyze(None, None, None, stop_below=None)
+_ALL_MISSING_POW_DIFFICULTY = _pow_difficulty(
+    _analyze(None, None, None, stop_below=40)
+)
@@ -524,7 +524,10 @@
       pending = null;
       lastVideoPush = 0;
 
-      for (const el of Object.values(pieceEls)) el.remove();
+      for (const el of Object.values(pieceEls)) {
+        if (el.src.startsWith("blob:")) URL.revokeObjectURL(el.src);
+        el.remove();
+      }
       pieceEls = {};
       piecesLayer.innerHTML = "";
       videoFrame.removeAttribute("src");
@@ -536,9 +539,17 @@
       piecesLayer.style.height = "300px";
 
       try {
-        const res = await fetch(`${SERVICE_URL}/generate-captcha?mode=${encodeURIComponent(mode)}`);
+        // Image pieces come back as raw PNG parts (no Base64); video
+        // mode ignores the format and still answers with JSON.
+        const res = await fetch(`${SERVICE_URL}/generate-captcha?mode=${encodeURIComponent(mode)}&format=multipart`);
         if (!res.ok) throw new Error(`HTTP ${res.status}`);
-        const data = await res.json();
+        let data, form = null;
+        if ((res.headers.get("Content-Type") || "").startsWith("multipart/")) {
+          form = await res.formData();
+          data = JSON.parse(form.get("meta"));
+        } else {
+          data = await res.json();
+        }
 
         captchaId = data.captcha_id;
         mode = data.mode === "video" ? "video" : "image";
@@ -581,7 +592,9 @@
             const img = document.createElement("img");
             img.className  = "uw-piece";
             img.draggable  = false;
-            img.src        = `data:image/png;base64,${info.data}`;
+            img.src        = form
+              ? URL.createObjectURL(form.get(pid))
+              : `data:image/png;base64,${info.data}`;
             img.dataset.id = pid;
             img.width      = info.w;
             img.height     = info.h;
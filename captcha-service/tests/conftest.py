@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# The service is run from its own directory (``uvicorn main:app``), so
+# tests import ``main`` / ``fingerprint`` the same way.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
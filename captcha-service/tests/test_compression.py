@@ -0,0 +1,32 @@
+"""Response compression tests (run with ``python -m pytest`` from captcha-service/)."""
+
+import pytest
+
+from fastapi.testclient import TestClient
+
+import main
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.app, headers={"Accept-Encoding": "gzip"})
+
+
+def test_json_captcha_is_gzipped(client):
+    response = client.get("/generate-captcha")
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+
+
+def test_multipart_captcha_is_not_gzipped(client):
+    response = client.get("/generate-captcha", params={"format": "multipart"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("multipart/form-data")
+    assert "content-encoding" not in response.headers
+
+
+def test_images_are_not_gzipped(client):
+    response = client.get("/static/logo.png")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    assert "content-encoding" not in response.headers
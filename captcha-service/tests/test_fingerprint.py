@@ -0,0 +1,212 @@
+"""Bot-risk analysis tests (run with ``python -m pytest`` from captcha-service/)."""
+
+import math
+
+import pytest
+
+import fingerprint
+from fingerprint import (
+    CaptchaSession,
+    analyze_bot_risk,
+    compute_pow_difficulty,
+    parse_behavior,
+    parse_trajectory,
+)
+
+HUMAN_FINGERPRINT = {
+    "user_agent": "Mozilla/5.0 (X11; Linux x86_64) Gecko/20100101 Firefox/128.0",
+    "screen_resolution": "1920x1080",
+    "webdriver": False,
+    "timezone_name": "Europe/Berlin",
+    "canvas_fingerprint": "c4f1e2",
+}
+HUMAN_BEHAVIOR = {
+    "total_duration_ms": 1800,
+    "event_count": 40,
+    "mouse_down_count": 1,
+    "mouse_move_count": 30,
+}
+
+
+@pytest.fixture(params=["numba", "numpy"])
+def backend(request, monkeypatch):
+    """Run a test once per trajectory-statistics backend, caches cleared."""
+    if request.param == "numba" and fingerprint._trajectory_kernel is None:
+        pytest.skip("numba not installed")
+    if request.param == "numpy":
+        monkeypatch.setattr(fingerprint, "_trajectory_kernel", None)
+    fingerprint._risk_cache.clear()
+    fingerprint._pow_cache.clear()
+    yield request.param
+    fingerprint._risk_cache.clear()
+    fingerprint._pow_cache.clear()
+
+
+def _points(values, velocities, deltas, time_deltas):
+    return [
+        {"timestamp": 1_700_000_000_000 + 16 * i, "value": v, "delta": d,
+         "velocity": vel, "time_delta_ms": td}
+        for i, (v, vel, d, td) in enumerate(zip(values, velocities, deltas, time_deltas))
+    ]
+
+
+def _session(points, fp=HUMAN_FINGERPRINT, behavior=HUMAN_BEHAVIOR):
+    return CaptchaSession(
+        solved_value=50,
+        fingerprint=fp,
+        trajectory=parse_trajectory(points),
+        behavior=parse_behavior(behavior),
+    )
+
+
+def _human_drag(n=60, end=73.0):
+    """Eased drag from 0 to *end* with jittered timing and two pauses."""
+    points, t, prev = [], 1_700_000_000_000, 0.0
+    for i in range(n):
+        value = end * (1 - math.cos(math.pi * i / (n - 1))) / 2
+        td = 0 if i == 0 else (180 if i in (17, 41) else 12 + (i * 7) % 9)
+        t += td
+        delta = value - prev
+        points.append({"timestamp": t, "value": round(value, 3), "delta": round(delta, 3),
+                       "velocity": round(1000 * delta / td, 3) if td else 0.0,
+                       "time_delta_ms": td})
+        prev = value
+    return points
+
+
+def _scripted_drag(n=30):
+    """Constant-speed drag in equal steps, as a naive bot produces."""
+    return [{"timestamp": 1_700_000_000_000 + 16 * i, "value": i * 0.1, "delta": 0.1,
+             "velocity": 0.00625, "time_delta_ms": 16} for i in range(n)]
+
+
+# (fingerprint, trajectory points, behaviour) -> (score, flags, PoW difficulty).
+# Expected values were produced by the original list-based analyze_bot_risk
+# on the same inputs; any change here is a behaviour change.
+BASELINE_CASES = {
+    "human": (
+        (HUMAN_FINGERPRINT, _human_drag(), HUMAN_BEHAVIOR),
+        (100, [], 15),
+    ),
+    "human_video_range": (
+        (HUMAN_FINGERPRINT, _human_drag(120, 812.0), HUMAN_BEHAVIOR),
+        (100, [], 15),
+    ),
+    "missing_fingerprint": (
+        (None, _human_drag(), HUMAN_BEHAVIOR),
+        (70, ["missing_fingerprint"], 15),
+    ),
+    "headless_browser": (
+        ({"user_agent": "HeadlessChrome", "screen_resolution": "0x0", "webdriver": True},
+         _human_drag(), HUMAN_BEHAVIOR),
+        (15, ["suspicious_user_agent", "invalid_screen_resolution", "webdriver_detected",
+              "missing_timezone", "missing_canvas_fingerprint"], 22),
+    ),
+    "scripted_drag": (
+        (HUMAN_FINGERPRINT, _scripted_drag(), HUMAN_BEHAVIOR),
+        (35, ["linear_velocity_pattern", "uniform_delta_pattern", "low_slider_entropy",
+              "no_movement_pauses"], 22),
+    ),
+    "short_trajectory": (
+        (HUMAN_FINGERPRINT, _human_drag()[:3], HUMAN_BEHAVIOR),
+        (70, ["insufficient_trajectory_data"], 15),
+    ),
+    "missing_behavior": (
+        (HUMAN_FINGERPRINT, _human_drag(), None),
+        (75, ["missing_behavior_data"], 15),
+    ),
+    "fast_behavior": (
+        (HUMAN_FINGERPRINT, _human_drag(),
+         {"total_duration_ms": 250, "event_count": 2, "mouse_down_count": 0,
+          "mouse_move_count": 2}),
+        (35, ["suspiciously_fast", "missing_mousedown", "insufficient_mouse_movement",
+              "low_event_count"], 22),
+    ),
+    "slow_behavior": (
+        (HUMAN_FINGERPRINT, _human_drag(),
+         {"total_duration_ms": 50_000, "event_count": 9, "mouse_down_count": 1,
+          "mouse_move_count": 5}),
+        (80, ["suspiciously_slow", "limited_mouse_movement"], 15),
+    ),
+    "zero_duration": (
+        (HUMAN_FINGERPRINT, _human_drag(),
+         {"total_duration_ms": 0, "event_count": 40, "mouse_down_count": 1,
+          "mouse_move_count": 30}),
+        (80, ["invalid_behavior_duration"], 15),
+    ),
+    "unsure": (
+        (None, _human_drag(),
+         {"total_duration_ms": 500, "event_count": 9, "mouse_down_count": 1,
+          "mouse_move_count": 5}),
+        (50, ["missing_fingerprint", "very_fast", "limited_mouse_movement"], 19),
+    ),
+    "all_missing": (
+        (None, None, None),
+        (15, ["missing_fingerprint", "insufficient_trajectory_data",
+              "missing_behavior_data"], 22),
+    ),
+    "bot": (
+        ({"user_agent": "curl/8", "webdriver": True}, _scripted_drag(), None),
+        (0, ["suspicious_user_agent", "invalid_screen_resolution", "webdriver_detected",
+             "missing_timezone", "missing_canvas_fingerprint", "linear_velocity_pattern",
+             "uniform_delta_pattern", "low_slider_entropy", "no_movement_pauses",
+             "missing_behavior_data"], 22),
+    ),
+}
+
+
+@pytest.mark.parametrize("case", BASELINE_CASES)
+def test_matches_baseline(backend, case):
+    (fp, points, behavior), (score, flags, difficulty) = BASELINE_CASES[case]
+    trajectory = parse_trajectory(points) if points is not None else None
+    parsed_behavior = parse_behavior(behavior)
+    session = CaptchaSession(
+        solved_value=50, fingerprint=fp, trajectory=trajectory, behavior=parsed_behavior,
+    )
+    result = analyze_bot_risk(session)
+    assert result["confidence_score"] == score
+    assert result["flags"] == flags
+    assert result["is_bot"] == (score < 60)
+    # Cached repeat must agree with the first evaluation.
+    assert analyze_bot_risk(session) == result
+
+    pow_difficulty = compute_pow_difficulty(fp, trajectory, parsed_behavior)
+    assert pow_difficulty["difficulty"] == difficulty
+
+
+@pytest.mark.parametrize("velocity", [3000000.1, 1e8 / 3, 12345.678])
+def test_large_constant_velocity_is_linear(backend, velocity):
+    n = 40
+    points = _points(
+        values=range(n),
+        velocities=[velocity] * n,
+        deltas=[1 + (i % 3) * 0.9 for i in range(n)],
+        time_deltas=[16 if i % 7 else 150 for i in range(n)],
+    )
+    result = analyze_bot_risk(_session(points))
+    assert result["flags"] == ["linear_velocity_pattern"]
+    assert result["confidence_score"] == 80
+
+
+@pytest.mark.parametrize("values, distinct", [
+    ([0, 1024, 2048, 3072] * 10, 4),
+    ([-1, -1025, 1023, 2047] * 10, 4),
+    ([-0.5, 0.5, 1e300, -1e300] * 10, 3),
+    ([float("nan"), float("inf"), float("-inf"), 7] * 10, 4),
+])
+def test_distinct_values_agree_across_backends(monkeypatch, values, distinct):
+    if fingerprint._trajectory_kernel is None:
+        pytest.skip("numba not installed")
+    n = len(values)
+    trajectory = parse_trajectory(_points(
+        values=values,
+        velocities=[0.5 + (i % 5) * 0.3 for i in range(n)],
+        deltas=[1 + (i % 3) * 0.9 for i in range(n)],
+        time_deltas=[16 if i % 7 else 150 for i in range(n)],
+    ))
+    columns = (trajectory.velocity, trajectory.delta, trajectory.value,
+               trajectory.time_delta_ms)
+    compiled = fingerprint._trajectory_stats(*columns)
+    monkeypatch.setattr(fingerprint, "_trajectory_kernel", None)
+    assert fingerprint._trajectory_stats(*columns) == pytest.approx(compiled)
+    assert compiled[4] == distinct
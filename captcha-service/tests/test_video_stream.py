@@ -0,0 +1,192 @@
+"""Video MJPEG stream tests (run with ``python -m pytest`` from captcha-service/)."""
+
+import asyncio
+import sys
+import threading
+import types
+
+import numpy as np
+import pytest
+
+from fastapi.testclient import TestClient
+
+import main
+
+FAKE_JPEG = b"\xff\xd8fake-jpeg\xff\xd9"
+
+
+@pytest.fixture
+def small_video(monkeypatch):
+    """Swap the decoded clip for a few tiny frames; no real decode."""
+    rng = np.random.default_rng(0)
+    frames = []
+    for _ in range(8):
+        frame = rng.integers(0, 256, (64, 64, 3), dtype=np.uint8)
+        frame.flags.writeable = False
+        frames.append(frame)
+    monkeypatch.setattr(main, "_video", (tuple(frames), 24.0))
+    monkeypatch.setattr(main.time, "sleep", lambda seconds: None)
+
+
+@pytest.fixture
+def fake_nvjpeg(monkeypatch):
+    """
+    Install a stand-in ``nvjpeg`` module whose encoder, like the real
+    one, must never be used by two threads or from a foreign thread.
+    """
+    instances = []
+
+    class NvJpeg:
+        def __init__(self):
+            self.owner = threading.get_ident()
+            self.busy = threading.Lock()
+            self.calls = 0
+            instances.append(self)
+
+        def encode(self, frame, quality):
+            assert threading.get_ident() == self.owner, "encoder shared across threads"
+            assert self.busy.acquire(blocking=False), "concurrent encode on one handle"
+            try:
+                threading.Event().wait(0.001)  # widen the race window
+                self.calls += 1
+                return FAKE_JPEG
+            finally:
+                self.busy.release()
+
+    module = types.ModuleType("nvjpeg")
+    module.NvJpeg = NvJpeg
+    monkeypatch.setitem(sys.modules, "nvjpeg", module)
+    monkeypatch.setattr(main, "_jpeg_encoder", main._load_jpeg_encoder())
+    return instances
+
+
+def test_nvjpeg_encoder_per_stream_thread(small_video, fake_nvjpeg):
+    # Two streams on one captcha id: the worst case for shared state.
+    captcha_id = main.generate_video_captcha()["captcha_id"]
+    parts_per_stream = 16
+    results: dict[int, list[bytes]] = {}
+    errors: list[BaseException] = []
+
+    def consume(index: int) -> None:
+        stream = main._generate_video_stream(captcha_id)
+        try:
+            results[index] = [next(stream) for _ in range(parts_per_stream)]
+        except BaseException as exc:  # surfaced below
+            errors.append(exc)
+        finally:
+            stream.close()
+
+    try:
+        threads = [threading.Thread(target=consume, args=(i,)) for i in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=30)
+    finally:
+        del main.video_captcha_sessions[captcha_id]
+
+    assert not errors, errors
+    for parts in results.values():
+        assert len(parts) == parts_per_stream
+        for part in parts:
+            assert part == main._MJPEG_PART_HEADER + FAKE_JPEG + main._MJPEG_PART_TAIL
+
+    # The import-time probe plus one encoder per producer thread.
+    used = [nv for nv in fake_nvjpeg if nv.calls]
+    assert len(used) == 2
+    assert len({nv.owner for nv in used}) == 2
+
+
+def test_jpeg_cache_shares_one_budget(small_video, monkeypatch):
+    probe_id = main.generate_video_captcha()["captcha_id"]
+    probe = main._generate_video_stream(probe_id)
+    part_size = len(next(probe))
+    probe.close()
+    del main.video_captcha_sessions[probe_id]
+    # Room for about five cached parts across every stream.
+    budget = part_size * 5 + part_size // 2
+    monkeypatch.setattr(main, "VIDEO_JPEG_CACHE_TOTAL_BYTES", budget)
+    assert main._jpeg_cache_total == 0
+
+    captcha_id = main.generate_video_captcha()["captcha_id"]
+    streams = [main._generate_video_stream(captcha_id) for _ in range(4)]
+    try:
+        for _ in range(8):  # one full loop of the 8-frame clip each
+            for stream in streams:
+                next(stream)
+                assert main._jpeg_cache_total <= budget
+        assert main._jpeg_cache_total > 0
+
+        # A slider move drops the mover's cache back into the pool.
+        slot = main.video_session_slots[captcha_id]
+        before = main._jpeg_cache_total
+        main.video_current_slider[slot] = 0.5
+        next(streams[0])
+        assert main._jpeg_cache_total < before
+    finally:
+        for stream in streams:
+            stream.close()
+        del main.video_captcha_sessions[captcha_id]
+
+    assert main._jpeg_cache_total == 0
+
+
+@pytest.fixture
+def one_stream_slot(monkeypatch):
+    slots = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(main, "_video_stream_slots", slots)
+    monkeypatch.setattr(main, "VIDEO_STREAM_STALL_TIMEOUT", 0.2)
+    return slots
+
+
+async def _wait_for_slot(slots: threading.BoundedSemaphore) -> bool:
+    for _ in range(100):
+        if slots.acquire(blocking=False):
+            slots.release()
+            return True
+        await asyncio.sleep(0.05)
+    return False
+
+
+def test_stream_rejected_when_slots_full(small_video, one_stream_slot):
+    captcha_id = main.generate_video_captcha()["captcha_id"]
+    assert one_stream_slot.acquire(blocking=False)
+    try:
+        response = TestClient(main.app).get(f"/video-captcha-stream/{captcha_id}")
+    finally:
+        one_stream_slot.release()
+        del main.video_captcha_sessions[captcha_id]
+    assert response.status_code == 503
+
+
+def test_stream_slot_released_on_disconnect(small_video, one_stream_slot):
+    captcha_id = main.generate_video_captcha()["captcha_id"]
+
+    async def run() -> bool:
+        assert one_stream_slot.acquire(blocking=False)
+        parts = main._start_video_stream(captcha_id)
+        for _ in range(3):
+            assert (await anext(parts)).startswith(main._MJPEG_PART_HEADER)
+        await parts.aclose()  # client went away
+        return await _wait_for_slot(one_stream_slot)
+
+    try:
+        assert asyncio.run(run())
+    finally:
+        del main.video_captcha_sessions[captcha_id]
+
+
+def test_stream_slot_released_when_never_read(small_video, one_stream_slot):
+    captcha_id = main.generate_video_captcha()["captcha_id"]
+
+    async def run() -> bool:
+        assert one_stream_slot.acquire(blocking=False)
+        parts = main._start_video_stream(captcha_id)  # body never iterated
+        released = await _wait_for_slot(one_stream_slot)
+        del parts
+        return released
+
+    try:
+        assert asyncio.run(run())
+    finally:
+        del main.video_captcha_sessions[captcha_id]
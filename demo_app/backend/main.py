@@ -15,8 +15,13 @@ API:
 
 from __future__ import annotations
 
+import sys
 import time
 import uuid
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 import httpx
@@ -29,10 +34,22 @@ import base58
 # ──────────────────────────────────────────────
 # App & CORS
 # ──────────────────────────────────────────────
+# One pooled client for calls to the CAPTCHA service, so health probes
+# reuse a keep-alive connection instead of reconnecting every time.
+_http_client = httpx.AsyncClient(timeout=3.0)
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    yield
+    await _http_client.aclose()
+
+
 app = FastAPI(
     title="Ad-CAPTCHA Platform",
     description="Publisher management, wallet auth, and Solana payment tracking.",
     version="1.0.0",
+    lifespan=_lifespan,
 )
 
 app.add_middleware(
@@ -47,21 +64,47 @@ app.add_middleware(
 # ──────────────────────────────────────────────
 CAPTCHA_SERVICE_URL = "http://localhost:8000"
 LAMPORTS_PER_SOLVE = 5_000_000  # 0.005 SOL per solve (demo)
+RECENT_SOLVES_LIMIT = 20  # solves listed in publisher stats
 
 # ──────────────────────────────────────────────
 # In-memory stores
 # ──────────────────────────────────────────────
+# Wallet addresses are interned on the way in: the same string is then
+# shared by publishers, wallet_to_site_key and auth_sessions.
+
+@dataclass(slots=True)
+class Publisher:
+    site_key: str
+    wallet_address: str
+    site_url: str
+    site_name: str
+    registered_at: float
+
+
+@dataclass(slots=True)
+class AuthSession:
+    session_token: str
+    authenticated_at: float
+    wallet_address: str
+
+
 # site_key -> publisher info
-publishers: dict[str, dict[str, Any]] = {}
+publishers: dict[str, Publisher] = {}
 
 # wallet_address -> site_key
 wallet_to_site_key: dict[str, str] = {}
 
-# site_key -> list of solve records
-solve_records: dict[str, list[dict[str, Any]]] = {}
+# Most recently registered wallet (for /api/publisher/latest)
+_last_wallet: str | None = None
+
+# site_key -> total number of recorded solves
+solve_counts: dict[str, int] = {}
+
+# site_key -> latest (captcha_id, timestamp) solves, oldest first
+recent_solves_dq: dict[str, deque[tuple[str, float]]] = {}
 
 # wallet_address -> auth session (for verified wallets)
-auth_sessions: dict[str, dict[str, Any]] = {}
+auth_sessions: dict[str, AuthSession] = {}
 
 
 # ──────────────────────────────────────────────
@@ -74,9 +117,8 @@ async def health():
     # Also check if captcha service is reachable
     captcha_ok = False
     try:
-        async with httpx.AsyncClient(timeout=3.0) as client:
-            resp = await client.get(f"{CAPTCHA_SERVICE_URL}/health")
-            captcha_ok = resp.status_code == 200
+        resp = await _http_client.get(f"{CAPTCHA_SERVICE_URL}/health")
+        captcha_ok = resp.status_code == 200
     except Exception:
         pass
 
@@ -90,6 +132,12 @@ async def health():
 # Wallet Authentication
 # ──────────────────────────────────────────────
 
+@lru_cache(maxsize=4096)
+def _verify_key(wallet_address: str) -> VerifyKey:
+    """Decode a base58 wallet address into an ed25519 key (memoised per wallet)."""
+    return VerifyKey(base58.b58decode(wallet_address))
+
+
 @app.post("/api/auth/verify-wallet")
 async def verify_wallet(body: dict[str, Any]):
     """
@@ -109,22 +157,22 @@ async def verify_wallet(body: dict[str, Any]):
         return {"success": False, "error": "wallet_address, signature, and message required."}
 
     try:
-        # Decode the public key and signature from base58
-        public_key_bytes = base58.b58decode(wallet_address)
+        # Decode the signature from base58; the wallet's key is cached
+        verify_key = _verify_key(wallet_address)
         signature_bytes = base58.b58decode(signature_b58)
         message_bytes = message.encode("utf-8") if isinstance(message, str) else message
 
         # Verify the signature using ed25519
-        verify_key = VerifyKey(public_key_bytes)
         verify_key.verify(message_bytes, signature_bytes)
 
         # Store auth session
+        wallet_address = sys.intern(wallet_address)
         session_token = uuid.uuid4().hex
-        auth_sessions[wallet_address] = {
-            "session_token": session_token,
-            "authenticated_at": time.time(),
-            "wallet_address": wallet_address,
-        }
+        auth_sessions[wallet_address] = AuthSession(
+            session_token=session_token,
+            authenticated_at=time.time(),
+            wallet_address=wallet_address,
+        )
 
         return {
             "success": True,
@@ -151,6 +199,8 @@ async def register_publisher(body: dict[str, Any]):
         "site_name": "My Website"
     }
     """
+    global _last_wallet
+
     wallet_address = body.get("wallet_address")
     site_url = body.get("site_url")
     site_name = body.get("site_name", "")
@@ -163,15 +213,18 @@ async def register_publisher(body: dict[str, Any]):
         existing_key = wallet_to_site_key[wallet_address]
         return {"success": True, "site_key": existing_key}
 
+    if isinstance(wallet_address, str):
+        wallet_address = sys.intern(wallet_address)
     site_key = uuid.uuid4().hex
-    publishers[site_key] = {
-        "site_key": site_key,
-        "wallet_address": wallet_address,
-        "site_url": site_url,
-        "site_name": site_name,
-        "registered_at": time.time(),
-    }
+    publishers[site_key] = Publisher(
+        site_key=site_key,
+        wallet_address=wallet_address,
+        site_url=site_url,
+        site_name=site_name,
+        registered_at=time.time(),
+    )
     wallet_to_site_key[wallet_address] = site_key
+    _last_wallet = wallet_address
 
     return {"success": True, "site_key": site_key}
 
@@ -179,12 +232,10 @@ async def register_publisher(body: dict[str, Any]):
 @app.get("/api/publisher/latest")
 async def latest_publisher():
     """Get the most recently registered publisher's site key (for demo)."""
-    if not wallet_to_site_key:
+    if _last_wallet is None:
         return {"success": False, "error": "No publishers registered yet."}
-    # Return the last registered wallet's site key
-    wallet = list(wallet_to_site_key.keys())[-1]
-    sk = wallet_to_site_key[wallet]
-    return {"success": True, "site_key": sk, "wallet_address": wallet}
+    sk = wallet_to_site_key[_last_wallet]
+    return {"success": True, "site_key": sk, "wallet_address": _last_wallet}
 
 
 @app.get("/api/publisher/{wallet}/stats")
@@ -194,17 +245,16 @@ async def publisher_stats(wallet: str):
     if not site_key:
         return {"success": False, "error": "Publisher not found."}
 
-    solves = solve_records.get(site_key, [])
-    total_solves = len(solves)
+    total_solves = solve_counts.get(site_key, 0)
     total_earned_lamports = total_solves * LAMPORTS_PER_SOLVE
 
     recent_solves = [
         {
-            "captcha_id": s["captcha_id"],
-            "timestamp": s["timestamp"],
+            "captcha_id": captcha_id,
+            "timestamp": timestamp,
             "reward_lamports": LAMPORTS_PER_SOLVE,
         }
-        for s in solves[-20:]
+        for captcha_id, timestamp in recent_solves_dq.get(site_key, ())
     ]
 
     return {
@@ -242,20 +292,17 @@ async def record_solve(body: dict[str, Any]):
     if site_key not in publishers:
         return {"success": False, "error": "Unknown site_key."}
 
-    solve_record = {
-        "captcha_id": captcha_id,
-        "site_key": site_key,
-        "timestamp": time.time(),
-    }
-    if site_key not in solve_records:
-        solve_records[site_key] = []
-    solve_records[site_key].append(solve_record)
+    solve_counts[site_key] = solve_counts.get(site_key, 0) + 1
+    recent = recent_solves_dq.get(site_key)
+    if recent is None:
+        recent = recent_solves_dq[site_key] = deque(maxlen=RECENT_SOLVES_LIMIT)
+    recent.append((captcha_id, time.time()))
 
     publisher = publishers[site_key]
     return {
         "success": True,
         "reward_lamports": LAMPORTS_PER_SOLVE,
-        "publisher_wallet": publisher["wallet_address"],
+        "publisher_wallet": publisher.wallet_address,
     }
 
 